@@ -0,0 +1,92 @@
+"""
+Viper bit-bang helpers for the MicroPython TM1637 driver
+https://github.com/mcauser/micropython-tm1637
+
+MIT License
+Copyright (c) 2016-2023 Mike Causer
+
+Kept out of tm1637.py as firmware built without the native emitter can't
+compile viper functions. tm1637.py falls back to driving the pins itself
+when this module can't be imported.
+"""
+
+import micropython
+from time import ticks_us, ticks_diff
+
+@micropython.viper
+def _spin(n: int):
+    for i in range(n):
+        pass
+
+def spin_iters(us):
+    """Return the number of busy loop iterations that take at least us microseconds.
+
+    The count is only valid at the current machine.freq(), raising the clock
+    afterwards shortens the delays."""
+    _spin(100) # warm up the cache
+    n = 10000
+    # an interrupt or gc during a run makes it look slower, so use the fastest
+    elapsed = None
+    for _ in range(3):
+        t = ticks_us()
+        _spin(n)
+        dt = ticks_diff(ticks_us(), t)
+        if elapsed is None or dt < elapsed:
+            elapsed = dt
+    return n * us // max(elapsed, 1) + 1
+
+@micropython.viper
+def send_frame(tm, cmd: int, buf: ptr8, n: int):
+    """Send a whole transaction for the TM1637 tm through its GPIO registers:
+    start, cmd, n bytes of buf, stop."""
+    gpio_set = ptr32(uint(tm._gpio_set))
+    gpio_clr = ptr32(uint(tm._gpio_clr))
+    clk = int(tm._clk_mask)
+    dio = int(tm._dio_mask)
+    d = int(tm._delay_iters)
+    # start
+    gpio_clr[0] = dio
+    for j in range(d):
+        pass
+    gpio_clr[0] = clk
+    for j in range(d):
+        pass
+
+    b = cmd
+    i = 0
+    while True:
+        for bit in range(8):
+            if (b >> bit) & 1:
+                gpio_set[0] = dio
+            else:
+                gpio_clr[0] = dio
+            for j in range(d):
+                pass
+            gpio_set[0] = clk
+            for j in range(d):
+                pass
+            gpio_clr[0] = clk
+            for j in range(d):
+                pass
+        gpio_clr[0] = clk
+        for j in range(d):
+            pass
+        gpio_set[0] = clk
+        for j in range(d):
+            pass
+        gpio_clr[0] = clk
+        for j in range(d):
+            pass
+        if i >= n:
+            break
+        b = int(buf[i])
+        i += 1
+
+    # stop
+    gpio_clr[0] = dio
+    for j in range(d):
+        pass
+    gpio_set[0] = clk
+    for j in range(d):
+        pass
+    gpio_set[0] = dio
@@ -0,0 +1,7 @@
+metadata(
+    description="MicroPython library for TM1637 LED driver.",
+    version="1.4.0",
+)
+
+# optimisation level 3 removes asserts and line numbers from the frozen bytecode
+module("tm1637.py", opt=3)
@@ -0,0 +1,4 @@
+# tm1637 plus its viper helpers, only for ports built with the native emitter
+include("manifest.py")
+
+module("_tm1637_viper.py", opt=3)
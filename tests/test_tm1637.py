@@ -83,6 +83,14 @@ tm.write([tm.encode_char('H'), tm.encode_char('e'), tm.encode_char('l'), tm.enco
 tm.scroll('Hello World') # 4 fps
 tm.scroll('Hello World', 1000) # 1 fps
 
+# Scroll an empty string, blanks the display
+tm.scroll('')
+
+# Scroll the same string object again, reuses its encoded segments
+marquee = 'Hello'
+tm.scroll(marquee)
+tm.scroll(marquee)
+
 # Scroll all available characters
 tm.scroll(list(tm1637._SEGMENTS))
 
@@ -160,6 +168,13 @@ tm.hex(0xbabe)
 # show "00FF" (hex right aligned)
 tm.hex(0xff)
 
+# show "012345"
+tm.hex(0x12345)
+
+# show "FFFFFF", only the lowest digits that fit are shown
+tm.hex(-1)
+tm.hex(0x1234567) # 234567
+
 # show "   1" (numbers right aligned)
 tm.number(1)
 
@@ -206,3 +221,9 @@ tm.temperature(-9)  # -9*C
 tm.temperature(5)   #  5*C
 tm.temperature(99)  # 99*C
 tm.temperature(100) # HI*C
+
+# on this 6 digit display the range is -999 to 9999
+tm.temperature(-20)   #  -20*C
+tm.temperature(150)   #  150*C
+tm.temperature(-1000) # LO  *C, positions after LO are blanked
+tm.temperature(10000) # HI  *C
@@ -29,6 +29,10 @@ __version__ = '1.4.0'
 from micropython import const
 from machine import Pin
 from time import sleep_us, sleep_ms
+try:
+    import _tm1637 # optional C module, see usermod/tm1637
+except ImportError:
+    _tm1637 = None
 
 TM1637_MAX_DIGITS = const(6)  # TM1637 supports up to 6 digits
 TM1637_CMD1 = const(64)  # 0x40 data command
@@ -39,7 +43,74 @@ TM1637_DELAY = const(10) # 10us delay between clk/dio pulses. TM1637 requires le
 TM1637_MSB = const(128)  # msb is the decimal point or the colon depending on your display
 
 # 0-9, a-z, blank, dash, star
-_SEGMENTS = bytearray(b'\x3F\x06\x5B\x4F\x66\x6D\x7D\x07\x7F\x6F\x77\x7C\x39\x5E\x79\x71\x3D\x76\x06\x1E\x76\x38\x55\x54\x3F\x73\x67\x50\x6D\x78\x3E\x1C\x2A\x76\x6E\x5B\x00\x40\x63')
+_SEGMENTS = b'\x3F\x06\x5B\x4F\x66\x6D\x7D\x07\x7F\x6F\x77\x7C\x39\x5E\x79\x71\x3D\x76\x06\x1E\x76\x38\x55\x54\x3F\x73\x67\x50\x6D\x78\x3E\x1C\x2A\x76\x6E\x5B\x00\x40\x63'
+
+# segments indexed by ascii code, 0xFF for characters that can't be displayed
+_CHAR_LUT = (
+    b'\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF' # 0-31: control characters
+    b'\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF'
+    b'\x00\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF\x63\xFF\xFF\x40\xFF\xFF' # 32-47: space, star at 42, dash at 45
+    b'\x3F\x06\x5B\x4F\x66\x6D\x7D\x07\x7F\x6F\xFF\xFF\xFF\xFF\xFF\xFF' # 48-63: 0-9
+    b'\xFF\x77\x7C\x39\x5E\x79\x71\x3D\x76\x06\x1E\x76\x38\x55\x54\x3F' # 64-79: A-O
+    b'\x73\x67\x50\x6D\x78\x3E\x1C\x2A\x76\x6E\x5B\xFF\xFF\xFF\xFF\xFF' # 80-95: P-Z
+    b'\xFF\x77\x7C\x39\x5E\x79\x71\x3D\x76\x06\x1E\x76\x38\x55\x54\x3F' # 96-111: a-o
+    b'\x73\x67\x50\x6D\x78\x3E\x1C\x2A\x76\x6E\x5B\xFF\xFF\xFF\xFF\xFF' # 112-127: p-z
+)
+
+# GPIO output set and clear registers, and number of pins they cover, keyed by chip
+_GPIO_REGS = {
+    'ESP8266': (0x60000304, 0x60000308, 16), # GPIO_OUT_W1TS, GPIO_OUT_W1TC
+    'ESP32': (0x3FF44008, 0x3FF4400C, 32),   # GPIO_OUT_W1TS_REG, GPIO_OUT_W1TC_REG
+    'RP2040': (0xD0000014, 0xD0000018, 30),  # SIO GPIO_OUT_SET, GPIO_OUT_CLR
+}
+
+def _pin_id(pin):
+    # Pin reprs look like 'Pin(5)' or 'Pin(GPIO5, mode=OUT)'
+    name = str(pin).split('(')[1].split(',')[0].split(')')[0]
+    return int(name.replace('GPIO', ''))
+
+def _gpio_regs(clk, dio):
+    """Return the (set, clear, clk mask, dio mask) registers for driving the
+    pins directly, or None if the chip or pins are not supported."""
+    try:
+        from os import uname
+    except ImportError:
+        return None
+    # uname().machine ends with the chip name, eg. 'Raspberry Pi Pico with RP2040'
+    regs = _GPIO_REGS.get(uname().machine.split()[-1])
+    if regs is None:
+        return None
+    try:
+        clk_id = _pin_id(clk)
+        dio_id = _pin_id(dio)
+    except (IndexError, ValueError):
+        return None
+    if not (0 <= clk_id < regs[2] and 0 <= dio_id < regs[2]):
+        return None
+    return regs[0], regs[1], 1 << clk_id, 1 << dio_id
+
+def _import_viper():
+    """Return the viper helpers module, or None if it can't be loaded."""
+    # only imported once registers are known, so other boards don't compile unused native code
+    try:
+        import _tm1637_viper # needs the native emitter, and a .mpy for the right arch
+    except (ImportError, SyntaxError, ValueError, MemoryError):
+        return None
+    return _tm1637_viper
+
+def _encode_number(segments, num, width):
+    # right aligned in the first width segments, with a leading dash when
+    # negative and blank padded. num must already be limited to fit
+    i = width - 1
+    n = -num if num < 0 else num
+    while True:
+        segments[i] = _SEGMENTS[n % 10]
+        n //= 10
+        if n == 0:
+            break
+        i -= 1
+    if num < 0:
+        segments[i - 1] = _SEGMENTS[37] # dash
 
 class TM1637(object):
     """Library for quad 7-segment LED modules based on the TM1637 LED driver."""
@@ -55,52 +126,137 @@ class TM1637(object):
             raise ValueError("Number of digits should be between 1 and 6")
         self._digits = digits
 
+        # limits depend only on the number of digits
+        self._num_max = 10**digits - 1
+        self._num_min = -10**(digits-1) + 1
+        self._temp_max = 10**(digits-2) - 1
+        self._temp_min = -10**(digits-3) + 1
+
         self.clk.init(Pin.OUT, value=0)
         self.dio.init(Pin.OUT, value=0)
         sleep_us(TM1637_DELAY)
 
+        if _tm1637 is not None:
+            # whole transactions are bit-banged by the C module
+            self._send = self._send_c
+        else:
+            # bit-bang through the GPIO registers where the chip is known
+            regs = _gpio_regs(clk, dio)
+            viper = _import_viper() if regs is not None else None
+            if viper is not None:
+                self._viper = viper
+                self._gpio_set, self._gpio_clr, self._clk_mask, self._dio_mask = regs
+                # busy loop between pin changes, sleep_us has too much call overhead.
+                # calibrated at the current machine.freq(), create the display after changing it
+                self._delay_iters = viper.spin_iters(TM1637_DELAY)
+                self._send = self._send_regs
+
+        # last string scrolled and its padded segments
+        self._scroll_key = None
+        self._scroll_data = None
+
+        # the chip keeps both settings, so write() doesn't resend them
         self._write_data_cmd()
         self._write_dsp_ctrl()
 
-    def _start(self):
-        self.dio(0)
+    def _send(self, cmd, data=b''):
+        # one bus transaction, a command byte followed by any data bytes
+        dio = self.dio
+        clk = self.clk
+        write_byte = self._write_byte
+        # start
+        dio(0)
         sleep_us(TM1637_DELAY)
-        self.clk(0)
+        clk(0)
         sleep_us(TM1637_DELAY)
 
-    def _stop(self):
-        self.dio(0)
+        write_byte(cmd)
+        for b in data:
+            write_byte(b)
+
+        # stop
+        dio(0)
         sleep_us(TM1637_DELAY)
-        self.clk(1)
+        clk(1)
         sleep_us(TM1637_DELAY)
-        self.dio(1)
+        dio(1)
+
+    def _send_regs(self, cmd, data=b''):
+        # viper needs a buffer, so lists and other iterables are copied into one
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytearray(data)
+        self._viper.send_frame(self, cmd, data, len(data))
+
+    def _send_c(self, cmd, data=b''):
+        _tm1637.send(self.clk, self.dio, cmd, data, TM1637_DELAY)
 
     def _write_data_cmd(self):
         # automatic address increment, normal mode
-        self._start()
-        self._write_byte(TM1637_CMD1)
-        self._stop()
+        self._send(TM1637_CMD1)
 
     def _write_dsp_ctrl(self):
         # display on, set brightness
-        self._start()
-        self._write_byte(TM1637_CMD3 | TM1637_DSP_ON | self._brightness)
-        self._stop()
+        self._send(TM1637_CMD3 | TM1637_DSP_ON | self._brightness)
 
     def _write_byte(self, b):
-        for i in range(8):
-            self.dio((b >> i) & 1)
-            sleep_us(TM1637_DELAY)
-            self.clk(1)
-            sleep_us(TM1637_DELAY)
-            self.clk(0)
-            sleep_us(TM1637_DELAY)
-        self.clk(0)
-        sleep_us(TM1637_DELAY)
-        self.clk(1)
-        sleep_us(TM1637_DELAY)
-        self.clk(0)
-        sleep_us(TM1637_DELAY)
+        dio = self.dio
+        clk = self.clk
+        delay = sleep_us
+        # unrolled, lsb first. pins treat any non-zero value as high
+        dio(b & 1)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        dio(b & 2)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        dio(b & 4)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        dio(b & 8)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        dio(b & 16)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        dio(b & 32)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        dio(b & 64)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        dio(b & 128)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
+        clk(1)
+        delay(TM1637_DELAY)
+        clk(0)
+        delay(TM1637_DELAY)
 
     def brightness(self, val=None):
         """Set the display brightness 0-7."""
@@ -121,14 +277,7 @@ class TM1637(object):
         and 3rd segments."""
         if not 0 <= pos < self._digits:
             raise ValueError("Position out of range")
-        self._write_data_cmd()
-        self._start()
-
-        self._write_byte(TM1637_CMD2 | pos)
-        for seg in segments:
-            self._write_byte(seg)
-        self._stop()
-        self._write_dsp_ctrl()
+        self._send(TM1637_CMD2 | pos, segments)
 
     def encode_digit(self, digit):
         """Convert a character 0-9, a-f to a segment."""
@@ -138,40 +287,40 @@ class TM1637(object):
         """Convert an up to the number of digits length string containing 0-9, a-z,
         space, dash, star to an array of segments, matching the length of the
         source string."""
+        encode_char = self.encode_char
         segments = bytearray(len(string))
         for i, c in enumerate(string):
-            segments[i] = self.encode_char(c)
+            segments[i] = encode_char(c)
         return segments
 
     def encode_char(self, char):
         """Convert a character 0-9, a-z, space, dash or star to a segment."""
         o = ord(char)
-        if o == 32:
-            return _SEGMENTS[36] # space
-        if o == 42:
-            return _SEGMENTS[38] # star/degrees
-        if o == 45:
-            return _SEGMENTS[37] # dash
-        if o >= 65 and o <= 90:
-            return _SEGMENTS[o-55] # uppercase A-Z
-        if o >= 97 and o <= 122:
-            return _SEGMENTS[o-87] # lowercase a-z
-        if o >= 48 and o <= 57:
-            return _SEGMENTS[o-48] # 0-9
+        if o < 128:
+            v = _CHAR_LUT[o]
+            if v != 0xFF:
+                return v
         raise ValueError("Character out of range: {:d} '{:s}'".format(o, chr(o)))
 
     def hex(self, val):
         """Display a hex value up to max digits, right aligned."""
-        mask = (1 << 8*self._digits) - 1
-        string = (f'{{:0{self._digits}x}}').format(val & mask)
-        self.write(self.encode_string(string))
+        # the first 16 segments are the hex digits 0-f
+        segments = bytearray(self._digits)
+        for i in range(self._digits - 1, -1, -1):
+            segments[i] = _SEGMENTS[val & 0x0f]
+            val >>= 4
+        self.write(segments)
 
     def number(self, num):
         """Display a numeric value -999 through 9999, right aligned."""
         # limit to range -999 to 9999
-        num = max(- 10**(self._digits-1) + 1, min(num, 10**self._digits - 1))
-        string = (f'{{0: >{self._digits}d}}').format(num)
-        self.write(self.encode_string(string))
+        if num > self._num_max:
+            num = self._num_max
+        elif num < self._num_min:
+            num = self._num_min
+        segments = bytearray(self._digits)
+        _encode_number(segments, num, self._digits)
+        self.write(segments)
 
     def numbers(self, num1, num2, colon=True):
         return self.hour_minute(num1, num2, colon)
@@ -179,22 +328,48 @@ class TM1637(object):
     def hour_minute(self, hour, minute, colon=True):
         """Display two numeric values -9 through 99, with leading zeros
         and separated by a colon."""
-        num1 = max(-9, min(hour, 99))
-        num2 = max(-9, min(minute, 99))
-        segments = self.encode_string('{0:0>2d}{1:0>2d}'.format(num1, num2))
+        num1 = hour
+        if num1 > 99:
+            num1 = 99
+        elif num1 < -9:
+            num1 = -9
+        num2 = minute
+        if num2 > 99:
+            num2 = 99
+        elif num2 < -9:
+            num2 = -9
+        # index the digits directly, negative values are a dash and one digit
+        segments = bytearray(4)
+        if num1 < 0:
+            segments[0] = _SEGMENTS[37] # dash
+            segments[1] = _SEGMENTS[-num1]
+        else:
+            segments[0] = _SEGMENTS[num1 // 10]
+            segments[1] = _SEGMENTS[num1 % 10]
+        if num2 < 0:
+            segments[2] = _SEGMENTS[37] # dash
+            segments[3] = _SEGMENTS[-num2]
+        else:
+            segments[2] = _SEGMENTS[num2 // 10]
+            segments[3] = _SEGMENTS[num2 % 10]
         if colon:
             segments[1] |= 0x80 # colon on
         self.write(segments)
 
     def temperature(self, num):
-        if num < - 10**(self._digits-3) + 1:
-            self.show('lo') # low
-        elif num > 10 ** (self._digits - 2) - 1:
-            self.show('hi') # high
+        # the whole display in one write, the value followed by degrees C
+        segments = bytearray(self._digits)
+        if num < self._temp_min:
+            segments[0] = _SEGMENTS[21] # low
+            segments[1] = _SEGMENTS[24]
+        elif num > self._temp_max:
+            segments[0] = _SEGMENTS[17] # high
+            segments[1] = _SEGMENTS[18]
         else:
-            string = (f'{{0: >{self._digits-2}d}}').format(num)
-            self.write(self.encode_string(string))
-        self.write([_SEGMENTS[38], _SEGMENTS[12]], self._digits - 2) # degrees C
+            _encode_number(segments, num, self._digits - 2)
+        segments[self._digits - 2] = _SEGMENTS[38] # degrees
+        segments[self._digits - 1] = _SEGMENTS[12] # C
+        self.write(segments)
 
     def show(self, string, colon=False):
         segments = self.encode_string(string[:self._digits])
@@ -203,10 +378,22 @@ class TM1637(object):
         self.write(segments)
 
     def scroll(self, string, delay=250):
-        segments = string if isinstance(string, list) else self.encode_string(string)
-        data = [0]*self._digits + segments + [0]*self._digits
-        for i in range(len(segments) + self._digits + 1):
-            self.write(data[0+i:self._digits+i])
+        if string is self._scroll_key:
+            # same string as the last scroll, eg. a looping marquee
+            data = self._scroll_data
+        else:
+            segments = string if isinstance(string, list) else self.encode_string(string)
+            # blank padding either side, each frame is a view into the one buffer
+            data = bytearray(len(segments) + 2*self._digits)
+            for i, seg in enumerate(segments):
+                data[self._digits + i] = seg
+            data = memoryview(data)
+            # lists can be changed by the caller, so only strings are remembered
+            if isinstance(string, str):
+                self._scroll_key = string
+                self._scroll_data = data
+        for i in range(len(data) - self._digits + 1):
+            self.write(data[i:self._digits+i])
             sleep_ms(delay)
 
 
@@ -223,12 +410,14 @@ class TM1637Decimal(TM1637):
         Convert an up to number of digits length string containing 0-9, a-z,
         space, dash, star and '.' to an array of segments, matching the length of
         the source string."""
-        segments = bytearray(len(string.replace('.','')))
+        # count rather than replace the dots, to avoid allocating a second string
+        segments = bytearray(len(string) - string.count('.'))
+        encode_char = self.encode_char
         j = 0
         for c in string:
             if c == '.' and j > 0:
                 segments[j-1] |= TM1637_MSB
                 continue
-            segments[j] = self.encode_char(c)
+            segments[j] = encode_char(c)
             j += 1
         return segments
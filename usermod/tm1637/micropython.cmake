@@ -0,0 +1,11 @@
+add_library(usermod_tm1637 INTERFACE)
+
+target_sources(usermod_tm1637 INTERFACE
+    ${CMAKE_CURRENT_LIST_DIR}/modtm1637.c
+)
+
+target_include_directories(usermod_tm1637 INTERFACE
+    ${CMAKE_CURRENT_LIST_DIR}
+)
+
+target_link_libraries(usermod INTERFACE usermod_tm1637)
@@ -0,0 +1,4 @@
+TM1637_MOD_DIR := $(USERMOD_DIR)
+
+SRC_USERMOD += $(TM1637_MOD_DIR)/modtm1637.c
+CFLAGS_USERMOD += -I$(TM1637_MOD_DIR)
@@ -0,0 +1,87 @@
+/*
+ * MicroPython TM1637 7-segment LED display driver, C bit-bang module
+ * https://github.com/mcauser/micropython-tm1637
+ *
+ * MIT License
+ * Copyright (c) 2016-2023 Mike Causer
+ *
+ * Sends whole TM1637 bus transactions (start, command byte, data bytes, stop)
+ * in one call. tm1637.py uses it automatically when built into the firmware.
+ */
+
+#include "py/runtime.h"
+#include "py/mphal.h"
+
+static void tm1637_write_byte(mp_hal_pin_obj_t clk, mp_hal_pin_obj_t dio, uint8_t b, mp_uint_t delay) {
+    // lsb first
+    for (int i = 0; i < 8; ++i) {
+        mp_hal_pin_write(dio, (b >> i) & 1);
+        mp_hal_delay_us(delay);
+        mp_hal_pin_write(clk, 1);
+        mp_hal_delay_us(delay);
+        mp_hal_pin_write(clk, 0);
+        mp_hal_delay_us(delay);
+    }
+    // clock out the ack bit
+    mp_hal_pin_write(clk, 0);
+    mp_hal_delay_us(delay);
+    mp_hal_pin_write(clk, 1);
+    mp_hal_delay_us(delay);
+    mp_hal_pin_write(clk, 0);
+    mp_hal_delay_us(delay);
+}
+
+// send(clk, dio, cmd, data, delay_us)
+static mp_obj_t tm1637_send(size_t n_args, const mp_obj_t *args) {
+    mp_hal_pin_obj_t clk = mp_hal_get_pin_obj(args[0]);
+    mp_hal_pin_obj_t dio = mp_hal_get_pin_obj(args[1]);
+    uint8_t cmd = mp_obj_get_int(args[2]);
+    mp_uint_t delay = mp_obj_get_int(args[4]);
+
+    // start
+    mp_hal_pin_write(dio, 0);
+    mp_hal_delay_us(delay);
+    mp_hal_pin_write(clk, 0);
+    mp_hal_delay_us(delay);
+
+    tm1637_write_byte(clk, dio, cmd, delay);
+
+    mp_buffer_info_t bufinfo;
+    if (mp_get_buffer(args[3], &bufinfo, MP_BUFFER_READ)) {
+        // bytes, bytearray, memoryview
+        const uint8_t *data = bufinfo.buf;
+        for (size_t i = 0; i < bufinfo.len; ++i) {
+            tm1637_write_byte(clk, dio, data[i], delay);
+        }
+    } else {
+        // list or any other iterable of ints
+        mp_obj_t iterable = mp_getiter(args[3], NULL);
+        mp_obj_t item;
+        while ((item = mp_iternext(iterable)) != MP_OBJ_STOP_ITERATION) {
+            tm1637_write_byte(clk, dio, mp_obj_get_int(item), delay);
+        }
+    }
+
+    // stop
+    mp_hal_pin_write(dio, 0);
+    mp_hal_delay_us(delay);
+    mp_hal_pin_write(clk, 1);
+    mp_hal_delay_us(delay);
+    mp_hal_pin_write(dio, 1);
+
+    return mp_const_none;
+}
+static MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(tm1637_send_obj, 5, 5, tm1637_send);
+
+static const mp_rom_map_elem_t tm1637_module_globals_table[] = {
+    { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR__tm1637) },
+    { MP_ROM_QSTR(MP_QSTR_send), MP_ROM_PTR(&tm1637_send_obj) },
+};
+static MP_DEFINE_CONST_DICT(tm1637_module_globals, tm1637_module_globals_table);
+
+const mp_obj_module_t tm1637_user_cmodule = {
+    .base = { &mp_type_module },
+    .globals = (mp_obj_dict_t *)&tm1637_module_globals,
+};
+
+MP_REGISTER_MODULE(MP_QSTR__tm1637, tm1637_user_cmodule);